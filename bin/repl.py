@@ -1,13 +1,21 @@
+import sys
+
 from monkey.lexer import Lexer
-from monkey.token import TokenType
+from monkey.token import Token, TokenType
+
+EOF_TOKEN = Token.get(TokenType.EOF, "")
 
 
 def repl() -> None:
+    lexer = Lexer("")
     while True:
-        line = input(">> ")
-        lexer = Lexer(line)
-        while (tok := lexer.next_token()).type_ != TokenType.EOF:
-            print(tok)
+        lexer.reset(input(">> "))
+        sys.stdout.write(
+            "".join(
+                f"{tok.type_.name} {tok.literal}\n"
+                for tok in iter(lexer.next_token, EOF_TOKEN)
+            )
+        )
 
 
 if __name__ == "__main__":
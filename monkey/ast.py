@@ -5,52 +5,61 @@ from monkey import token
 
 
 class Node(abc.ABC):
+    __slots__ = ()
+
     @abc.abstractmethod
     def token_literal(self) -> str:
         pass
 
-    @abc.abstractmethod
     def string(self) -> str:
-        pass
+        out: list[str] = []
+        self._write(out)
+        return "".join(out)
 
-    def __eq__(self, other: object) -> bool:
-        if not isinstance(other, Node):
-            return NotImplemented
-        return self.__dict__ == other.__dict__
+    @abc.abstractmethod
+    def _write(self, out: list[str]) -> None:
+        pass
 
 
 class Statement(Node, abc.ABC):
-    pass
+    __slots__ = ()
 
 
 class Expression(Node, abc.ABC):
-    pass
+    __slots__ = ()
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class Program(Node):
     statements: list[Statement] = dataclasses.field(default_factory=lambda: [])
 
     def token_literal(self) -> str:
         return self.statements[0].token_literal() if self.statements else ""
 
-    def string(self) -> str:
-        return "\n".join(statement.string() for statement in self.statements)
+    def _write(self, out: list[str]) -> None:
+        _write_statements(out, self.statements)
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class Identifier(Expression):
     token: token.Token
     value: str
 
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if type(other) is not Identifier:
+            return NotImplemented
+        return self.value == other.value and self.token == other.token
+
     def token_literal(self) -> str:
         return self.token.literal
 
-    def string(self) -> str:
-        return self.value
+    def _write(self, out: list[str]) -> None:
+        out.append(self.value)
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class LetStatement(Statement):
     token: token.Token
     name: Identifier
@@ -59,11 +68,16 @@ class LetStatement(Statement):
     def token_literal(self) -> str:
         return self.token.literal
 
-    def string(self) -> str:
-        return f"{self.token.literal} {self.name.string()} = {self.value.string()};"
+    def _write(self, out: list[str]) -> None:
+        out.append(self.token.literal)
+        out.append(" ")
+        self.name._write(out)
+        out.append(" = ")
+        self.value._write(out)
+        out.append(";")
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class ReturnStatement(Statement):
     token: token.Token
     return_value: Expression
@@ -71,11 +85,14 @@ class ReturnStatement(Statement):
     def token_literal(self) -> str:
         return self.token.literal
 
-    def string(self) -> str:
-        return f"{self.token.literal} {self.return_value.string()};"
+    def _write(self, out: list[str]) -> None:
+        out.append(self.token.literal)
+        out.append(" ")
+        self.return_value._write(out)
+        out.append(";")
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class ExpressionStatement(Statement):
     token: token.Token
     expression: Expression
@@ -83,62 +100,106 @@ class ExpressionStatement(Statement):
     def token_literal(self) -> str:
         return self.token.literal
 
-    def string(self) -> str:
-        return self.expression.string()
+    def _write(self, out: list[str]) -> None:
+        self.expression._write(out)
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class IntegerLiteral(Expression):
     token: token.Token
     value: int
 
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if type(other) is not IntegerLiteral:
+            return NotImplemented
+        return self.value == other.value and self.token == other.token
+
     def token_literal(self) -> str:
         return self.token.literal
 
-    def string(self) -> str:
-        return f"{self.value}"
+    def _write(self, out: list[str]) -> None:
+        out.append(str(self.value))
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class PrefixExpression(Expression):
     token: token.Token
     operator: str
     right: Expression
 
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if type(other) is not PrefixExpression:
+            return NotImplemented
+        return (
+            self.operator == other.operator
+            and self.right == other.right
+            and self.token == other.token
+        )
+
     def token_literal(self) -> str:
         return self.token.literal
 
-    def string(self) -> str:
-        return f"({self.operator}{self.right.string()})"
+    def _write(self, out: list[str]) -> None:
+        out.append("(")
+        out.append(self.operator)
+        self.right._write(out)
+        out.append(")")
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class InfixExpression(Expression):
     token: token.Token
     left: Expression
     operator: str
     right: Expression
 
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if type(other) is not InfixExpression:
+            return NotImplemented
+        return (
+            self.operator == other.operator
+            and self.left == other.left
+            and self.right == other.right
+            and self.token == other.token
+        )
+
     def token_literal(self) -> str:
         return self.token.literal
 
-    def string(self) -> str:
-        return f"({self.left.string()} {self.operator} {self.right.string()})"
+    def _write(self, out: list[str]) -> None:
+        out.append("(")
+        self.left._write(out)
+        out.append(f" {self.operator} ")
+        self.right._write(out)
+        out.append(")")
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class Boolean(Expression):
     token: token.Token
     value: bool
 
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if type(other) is not Boolean:
+            return NotImplemented
+        return self.value == other.value and self.token == other.token
+
     def token_literal(self) -> str:
         return self.token.literal
 
-    def string(self) -> str:
-        return str(self.value).lower()
+    def _write(self, out: list[str]) -> None:
+        out.append("true" if self.value else "false")
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class BlockStatement(Statement):
     token: token.Token
     statements: list[Statement]
@@ -146,11 +207,11 @@ class BlockStatement(Statement):
     def token_literal(self) -> str:
         return self.token.literal
 
-    def string(self) -> str:
-        return "\n".join(statement.string() for statement in self.statements)
+    def _write(self, out: list[str]) -> None:
+        _write_statements(out, self.statements)
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class IfExpression(Expression):
     token: token.Token
     condition: Expression
@@ -160,8 +221,18 @@ class IfExpression(Expression):
     def token_literal(self) -> str:
         return self.token.literal
 
-    def string(self) -> str:
-        s = f"if {self.condition.string()} {self.consequence.string()}"
+    def _write(self, out: list[str]) -> None:
+        out.append("if ")
+        self.condition._write(out)
+        out.append(" ")
+        self.consequence._write(out)
         if self.alternative:
-            s += f"else {self.alternative.string()}"
-        return s
+            out.append("else ")
+            self.alternative._write(out)
+
+
+def _write_statements(out: list[str], statements: list[Statement]) -> None:
+    for i, statement in enumerate(statements):
+        if i:
+            out.append("\n")
+        statement._write(out)
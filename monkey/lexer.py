@@ -1,87 +1,86 @@
-from typing import Dict
-
-from monkey.token import Token, TokenType
+import re
+import string
+import sys
+from typing import Dict, List, Tuple
+
+from monkey.token import KEYWORDS, SYMBOLS, Token, TokenType
+
+# Each match is one token: leading whitespace is consumed and the token's
+# literal is captured. Trailing whitespace never matches, which ends the scan.
+# Alternatives are tried in order of how often they occur in Monkey source:
+# identifiers and integers first (their leading characters never start a
+# symbol), then the multi-character symbols from the token table, longest
+# first. Single-character symbols are caught by the final class.
+_TOKEN_RE = re.compile(
+    r"[ \t\n]*([A-Za-z_][A-Za-z0-9_]*|[0-9]+|"
+    + "".join(
+        re.escape(symbol) + "|"
+        for symbol in sorted(SYMBOLS, key=len, reverse=True)
+        if len(symbol) > 1
+    )
+    + r"[^ \t\n])"
+)
 
 
 class Lexer:
+    __slots__ = ("source", "_literals", "_next")
+
     source: str
-    pos: int
 
     def __init__(self, source: str) -> None:
-        self.source = source
-        self.pos = 0
-
-    def next_token(self) -> Token:
-        if self.pos >= len(self.source):
-            return Token(TokenType.EOF, "")
-
-        self._skip_whitespace()
-
-        if self.pos >= len(self.source):
-            return Token(TokenType.EOF, "")
-
-        char = self.source[self.pos]
-        if char == "=":
-            self.pos += 1
-            if self.peek_char() == "=":
-                self.pos += 1
-                return Token(TokenType.EQ, "==")
-            else:
-                return Token(TokenType.ASSIGN, char)
-        elif char == "!":
-            self.pos += 1
-            if self.peek_char() == "=":
-                self.pos += 1
-                return Token(TokenType.NOT_EQ, "!=")
-            else:
-                return Token(TokenType.BANG, char)
-        elif (token_type := TokenType.get(char)) is not None:
-            self.pos += 1
-            return Token(token_type, char)
-        elif char.isalpha():
-            literal = self._read_identifier()
-            return Token(_lookup_ident(literal), literal)
-        elif char.isnumeric():
-            literal = self._read_number()
-            return Token(TokenType.INT, literal)
-        else:
-            self.pos += 1
-            return Token(TokenType.ILLEGAL, char)
-
-    def _read_identifier(self) -> str:
-        pos = self.pos
-        while _is_letter(self.peek_char()):
-            self.pos += 1
-        return self.source[pos : self.pos]
+        self.reset(source)
 
-    def _read_number(self) -> str:
-        pos = self.pos
-        while self.peek_char().isnumeric():
-            self.pos += 1
-        return self.source[pos : self.pos]
-
-    def _skip_whitespace(self) -> None:
-        while self.peek_char() in (" ", "\t", "\n"):
-            self.pos += 1
-
-    def peek_char(self) -> str:
-        return self.source[self.pos] if self.pos < len(self.source) else ""
+    def reset(self, source: str) -> None:
+        self.source = source
+        self._literals: List[str] | None = None
+        self._next = 0
 
+    # All literals are cut out of the source by a single findall() call the
+    # first time they are needed; tokens are then handed out from that list.
+    def _scan(self) -> List[str]:
+        if self._literals is None:
+            self._literals = _TOKEN_RE.findall(self.source)
+        return self._literals
 
-KEYWORDS: Dict[str, TokenType] = {
-    "let": TokenType.LET,
-    "fn": TokenType.FUNCTION,
-    "true": TokenType.TRUE,
-    "false": TokenType.FALSE,
-    "if": TokenType.IF,
-    "else": TokenType.ELSE,
-    "return": TokenType.RETURN,
+    def next_token(self) -> Token:
+        literals = self._scan()
+        i = self._next
+        if i == len(literals):
+            return _EOF
+        self._next = i + 1
+        literal = literals[i]
+        return _FIXED_TOKENS.get(literal) or Token(
+            _LITERAL_TYPES.get(literal[0], TokenType.ILLEGAL), literal
+        )
+
+    # Returns the remaining tokens as parallel lists of token types and
+    # literals, terminated by EOF. Literals are interned so that repeated
+    # identifiers share one string and hash/compare by identity downstream.
+    def tokenize(self) -> Tuple[List[TokenType], List[str]]:
+        literals = list(map(sys.intern, self._scan()[self._next :]))
+        self._next += len(literals)
+        literal_types = _LITERAL_TYPES
+        illegal = TokenType.ILLEGAL
+        types = [
+            literal_types.get(literal) or literal_types.get(literal[0], illegal)
+            for literal in literals
+        ]
+        types.append(TokenType.EOF)
+        literals.append("")
+        return types, literals
+
+
+# Token type per literal for the literals that always produce the same type,
+# plus the type of every other literal keyed by its leading character. Leading
+# characters are letters, digits and "_", so they never clash with a symbol.
+_LITERAL_TYPES: Dict[str, TokenType] = {
+    **dict.fromkeys(string.digits, TokenType.INT),
+    **dict.fromkeys(string.ascii_letters + "_", TokenType.IDENT),
+    **SYMBOLS,
+    **KEYWORDS,
 }
 
-
-def _lookup_ident(ident: str) -> TokenType:
-    return KEYWORDS.get(ident, TokenType.IDENT)
-
-
-def _is_letter(char: str) -> bool:
-    return char.isalnum() or char in ("_",)
+_FIXED_TOKENS: Dict[str, Token] = {
+    literal: Token.get(tt, literal) for literal, tt in {**SYMBOLS, **KEYWORDS}.items()
+}
+_EOF = Token.get(TokenType.EOF, "")
@@ -1,10 +1,13 @@
+import functools
 from enum import IntEnum, auto
-from typing import Callable
+from typing import Callable, Mapping, TypeVar
 
 from monkey import lexer, token, ast
 
-PrefixParseFuncType = Callable[[], ast.Expression]
-InfixParseFuncType = Callable[[ast.Expression], ast.Expression]
+T = TypeVar("T")
+
+StatementParseFuncType = Callable[["Parser"], ast.Statement]
+PrefixParseFuncType = Callable[["Parser"], ast.Expression]
 
 
 class UnexpectedTokenType(Exception):
@@ -24,97 +27,110 @@ class Precedence(IntEnum):
     PREFIX = auto()
     CALL = auto()
 
-    @classmethod
-    def get(cls, token_type: token.TokenType, default: "Precedence") -> "Precedence":
-        return {
-            token.TokenType.EQ: cls.EQUALS,
-            token.TokenType.NOT_EQ: cls.EQUALS,
-            token.TokenType.LT: cls.LESSGREATER,
-            token.TokenType.GT: cls.LESSGREATER,
-            token.TokenType.PLUS: cls.SUM,
-            token.TokenType.MINUS: cls.SUM,
-            token.TokenType.SLASH: cls.PRODUCT,
-            token.TokenType.ASTERISK: cls.PRODUCT,
-        }.get(token_type, default)
+
+PRECEDENCES: dict[token.TokenType, Precedence] = {
+    token.TokenType.EQ: Precedence.EQUALS,
+    token.TokenType.NOT_EQ: Precedence.EQUALS,
+    token.TokenType.LT: Precedence.LESSGREATER,
+    token.TokenType.GT: Precedence.LESSGREATER,
+    token.TokenType.PLUS: Precedence.SUM,
+    token.TokenType.MINUS: Precedence.SUM,
+    token.TokenType.SLASH: Precedence.PRODUCT,
+    token.TokenType.ASTERISK: Precedence.PRODUCT,
+}
+
+
+def _index_by_type(table: Mapping[token.TokenType, T], default: T) -> tuple[T, ...]:
+    by_type = [default] * (max(token.TokenType) + 1)
+    for token_type, value in table.items():
+        by_type[token_type] = value
+    return tuple(by_type)
+
+
+_PRECEDENCE_BY_TYPE = _index_by_type(PRECEDENCES, Precedence.LOWEST)
+
+# Shared tokens for the token types whose literal never varies.
+_TOKEN_BY_TYPE: tuple[token.Token | None, ...] = _index_by_type(
+    {
+        token_type: token.Token.get(token_type, literal)
+        for literal, token_type in {**token.SYMBOLS, **token.KEYWORDS}.items()
+    },
+    None,
+)
 
 
 class Parser:
+    __slots__ = (
+        "lexer",
+        "errors",
+        "_types",
+        "_literals",
+        "_last",
+        "_cur",
+        "_identifiers",
+        "_integers",
+    )
+
     def __init__(self, lexer_: lexer.Lexer) -> None:
         self.lexer = lexer_
         self.errors: list[str] = []
-        self.current_token: token.Token = self.lexer.next_token()
-        self.peek_token: token.Token = self.lexer.next_token()
-
-    def get_prefix_parse_func(
-        self, token_type: token.TokenType
-    ) -> PrefixParseFuncType | None:
-        parse_funcs: dict[token.TokenType, PrefixParseFuncType] = {
-            token.TokenType.IDENT: self.parse_identifier,
-            token.TokenType.INT: self.parse_integer_literal,
-            token.TokenType.BANG: self.parse_prefix_expression,
-            token.TokenType.MINUS: self.parse_prefix_expression,
-            token.TokenType.TRUE: self.parse_boolean,
-            token.TokenType.FALSE: self.parse_boolean,
-            token.TokenType.LPAREN: self.parse_grouped_expression,
-            token.TokenType.IF: self.parse_if_expression,
-        }
-        return parse_funcs.get(token_type)
-
-    def get_infix_parse_func(
-        self, token_type: token.TokenType
-    ) -> InfixParseFuncType | None:
-        parse_funcs: dict[token.TokenType, InfixParseFuncType] = {
-            token.TokenType.PLUS: self.parse_infix_expression,
-            token.TokenType.MINUS: self.parse_infix_expression,
-            token.TokenType.SLASH: self.parse_infix_expression,
-            token.TokenType.ASTERISK: self.parse_infix_expression,
-            token.TokenType.EQ: self.parse_infix_expression,
-            token.TokenType.NOT_EQ: self.parse_infix_expression,
-            token.TokenType.LT: self.parse_infix_expression,
-            token.TokenType.GT: self.parse_infix_expression,
-        }
-        return parse_funcs.get(token_type)
+        self._types, self._literals = self.lexer.tokenize()
+        # The token stream ends with EOF; pad it with a second EOF so that the
+        # peek position stays valid once the cursor has reached the first one.
+        self._last = len(self._types) - 1
+        self._types.append(token.TokenType.EOF)
+        self._literals.append("")
+        self._cur = 0
+        # AST nodes are immutable, so each distinct identifier and integer
+        # literal only needs one node per parse.
+        self._identifiers: dict[str, ast.Identifier] = {}
+        self._integers: dict[str, ast.IntegerLiteral] = {}
+
+    @property
+    def current_token(self) -> token.Token:
+        return self._token_at(self._cur)
+
+    @property
+    def peek_token(self) -> token.Token:
+        return self._token_at(self._cur + 1)
+
+    def _token_at(self, i: int) -> token.Token:
+        token_type = self._types[i]
+        return _TOKEN_BY_TYPE[token_type] or token.Token(token_type, self._literals[i])
 
     def next_token(self) -> None:
-        self.current_token = self.peek_token
-        self.peek_token = self.lexer.next_token()
+        if self._cur < self._last:
+            self._cur += 1
 
     def expect_peek_and_next(self, token_type: token.TokenType) -> None:
-        if not self.peek_token.is_type(token_type):
+        peek_type = self._types[self._cur + 1]
+        if peek_type != token_type:
             self.errors.append(
-                f"Expected next token to be {token_type.name}, got {self.peek_token.type_.name} instead"
+                f"Expected next token to be {token_type.name}, got {peek_type.name} instead"
             )
             raise UnexpectedTokenType
         self.next_token()
 
-    def current_precedence(self) -> Precedence:
-        return Precedence.get(self.current_token.type_, Precedence.LOWEST)
-
-    def peek_precedence(self) -> Precedence:
-        return Precedence.get(self.peek_token.type_, Precedence.LOWEST)
-
     def parse_program(self) -> ast.Program:
         program = ast.Program()
+        statements = program.statements
+        types = self._types
+        parse_statement = self.parse_statement
+        next_token = self.next_token
 
-        while not self.current_token.is_type(token.TokenType.EOF):
+        while types[self._cur] != token.TokenType.EOF:
             try:
-                statement = self.parse_statement()
+                statement = parse_statement()
             except (UnexpectedTokenType, NoPrefixParseFuncError):
                 pass
             else:
-                program.statements.append(statement)
+                statements.append(statement)
             finally:
-                self.next_token()
+                next_token()
         return program
 
     def parse_statement(self) -> ast.Statement:
-        match self.current_token.type_:
-            case token.TokenType.LET:
-                return self.parse_let_statement()
-            case token.TokenType.RETURN:
-                return self.parse_return_statement()
-            case _:
-                return self.parse_expression_statement()
+        return _STATEMENT_PARSER_BY_TYPE[self._types[self._cur]](self)
 
     def parse_let_statement(self) -> ast.LetStatement:
         tok = self.current_token
@@ -123,7 +139,7 @@ class Parser:
         self.expect_peek_and_next(token.TokenType.ASSIGN)
         self.next_token()
         expression = self.parse_expression(Precedence.LOWEST)
-        while not self.current_token.is_type(token.TokenType.SEMICOLON):
+        while self._types[self._cur] != token.TokenType.SEMICOLON:
             self.next_token()
         return ast.LetStatement(token=tok, name=ident, value=expression)
 
@@ -131,7 +147,7 @@ class Parser:
         tok = self.current_token
         self.next_token()
         expression = self.parse_expression(Precedence.LOWEST)
-        while not self.current_token.is_type(token.TokenType.SEMICOLON):
+        while self._types[self._cur] != token.TokenType.SEMICOLON:
             self.next_token()
         return ast.ReturnStatement(token=tok, return_value=expression)
 
@@ -140,47 +156,73 @@ class Parser:
             token=self.current_token,
             expression=self.parse_expression(Precedence.LOWEST),
         )
-        if self.peek_token.is_type(token.TokenType.SEMICOLON):
+        if self._types[self._cur + 1] == token.TokenType.SEMICOLON:
             self.next_token()
         return statement
 
     def parse_expression(self, precedence: Precedence) -> ast.Expression:
-        prefix_parse_func = self.get_prefix_parse_func(self.current_token.type_)
+        # Binary operators are handled with explicit operand/operator stacks
+        # instead of recursing once per operator. An operator on the stack is
+        # reduced as soon as an operator that binds no tighter follows it,
+        # which keeps the left associativity of the recursive Pratt parser.
+        operands = [self._parse_prefix_expression()]
+        operators: list[token.TokenType] = []
+
+        types = self._types
+        parse_prefix_expression = self._parse_prefix_expression
+
+        while True:
+            peek_type = types[self._cur + 1]
+            if peek_type == token.TokenType.SEMICOLON:
+                break
+            peek_precedence = _PRECEDENCE_BY_TYPE[peek_type]
+            if precedence >= peek_precedence:
+                break
+
+            while operators and _PRECEDENCE_BY_TYPE[operators[-1]] >= peek_precedence:
+                _reduce_infix(operands, operators.pop())
+            operators.append(peek_type)
+            # An operator is never EOF, so skipping over it and onto its right
+            # operand cannot run past the end of the token stream.
+            self._cur += 2
+            operands.append(parse_prefix_expression())
+
+        while operators:
+            _reduce_infix(operands, operators.pop())
+        return operands[0]
+
+    def _parse_prefix_expression(self) -> ast.Expression:
+        current_type = self._types[self._cur]
+        prefix_parse_func = _PREFIX_PARSER_BY_TYPE[current_type]
         if prefix_parse_func is None:
             self.errors.append(
-                f"No prefix parse function for {self.current_token.type_.name} found"
+                f"No prefix parse function for {current_type.name} found"
             )
             raise NoPrefixParseFuncError
-        left_expression = prefix_parse_func()
-
-        while (
-            not self.peek_token.is_type(token.TokenType.SEMICOLON)
-            and precedence < self.peek_precedence()
-        ):
-            infix_parse_func = self.get_infix_parse_func(self.peek_token.type_)
-            if infix_parse_func is None:
-                return left_expression
-
-            self.next_token()
-            left_expression = infix_parse_func(left_expression)
-
-        return left_expression
+        return prefix_parse_func(self)
 
     def parse_identifier(self) -> ast.Identifier:
-        return ast.Identifier(
-            token=self.current_token, value=self.current_token.literal
-        )
+        literal = self._literals[self._cur]
+        identifier = self._identifiers.get(literal)
+        if identifier is None:
+            identifier = ast.Identifier(token=self.current_token, value=literal)
+            self._identifiers[literal] = identifier
+        return identifier
 
     def parse_integer_literal(self) -> ast.IntegerLiteral:
-        return ast.IntegerLiteral(
-            token=self.current_token, value=int(self.current_token.literal, 10)
-        )
+        literal = self._literals[self._cur]
+        integer = self._integers.get(literal)
+        if integer is None:
+            integer = ast.IntegerLiteral(
+                token=self.current_token, value=_parse_int(literal)
+            )
+            self._integers[literal] = integer
+        return integer
 
     def parse_boolean(self) -> ast.Boolean:
-        return ast.Boolean(
-            token=self.current_token,
-            value=self.current_token.type_ == token.TokenType.TRUE,
-        )
+        if self._types[self._cur] == token.TokenType.TRUE:
+            return _TRUE
+        return _FALSE
 
     def parse_prefix_expression(self) -> ast.PrefixExpression:
         tok = self.current_token
@@ -191,15 +233,6 @@ class Parser:
             right=self.parse_expression(Precedence.PREFIX),
         )
 
-    def parse_infix_expression(self, left: ast.Expression) -> ast.InfixExpression:
-        tok = self.current_token
-        precedence = self.current_precedence()
-        self.next_token()
-        right = self.parse_expression(precedence)
-        return ast.InfixExpression(
-            token=tok, operator=tok.literal, left=left, right=right
-        )
-
     def parse_grouped_expression(self) -> ast.Expression:
         self.next_token()
         expression = self.parse_expression(Precedence.LOWEST)
@@ -219,7 +252,7 @@ class Parser:
         self.expect_peek_and_next(token.TokenType.RBRACE)
 
         alternative: ast.BlockStatement | None = None
-        if self.peek_token.is_type(token.TokenType.ELSE):
+        if self._types[self._cur + 1] == token.TokenType.ELSE:
             self.next_token()
             self.expect_peek_and_next(token.TokenType.LBRACE)
             alternative = self.parse_block_statement()
@@ -235,7 +268,62 @@ class Parser:
     def parse_block_statement(self) -> ast.BlockStatement:
         tok = self.current_token
         statements: list[ast.Statement] = []
-        while not self.peek_token.is_type(token.TokenType.RBRACE, token.TokenType.EOF):
-            self.next_token()
-            statements.append(self.parse_statement())
+        types = self._types
+        parse_statement = self.parse_statement
+        next_token = self.next_token
+
+        while types[self._cur + 1] not in (
+            token.TokenType.RBRACE,
+            token.TokenType.EOF,
+        ):
+            next_token()
+            statements.append(parse_statement())
         return ast.BlockStatement(token=tok, statements=statements)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_int(literal: str) -> int:
+    return int(literal, 10)
+
+
+# AST nodes are immutable, so every boolean literal can share one of these.
+_TRUE = ast.Boolean(token=token.Token.get(token.TokenType.TRUE, "true"), value=True)
+_FALSE = ast.Boolean(token=token.Token.get(token.TokenType.FALSE, "false"), value=False)
+
+
+def _reduce_infix(
+    operands: list[ast.Expression], operator_type: token.TokenType
+) -> None:
+    # Binary operators are symbols, so their token is always a shared one.
+    tok = _TOKEN_BY_TYPE[operator_type]
+    assert tok is not None
+    right = operands.pop()
+    left = operands.pop()
+    operands.append(
+        ast.InfixExpression(token=tok, left=left, operator=tok.literal, right=right)
+    )
+
+
+_STATEMENT_PARSERS: dict[token.TokenType, StatementParseFuncType] = {
+    token.TokenType.LET: Parser.parse_let_statement,
+    token.TokenType.RETURN: Parser.parse_return_statement,
+}
+
+_PREFIX_PARSERS: dict[token.TokenType, PrefixParseFuncType] = {
+    token.TokenType.IDENT: Parser.parse_identifier,
+    token.TokenType.INT: Parser.parse_integer_literal,
+    token.TokenType.BANG: Parser.parse_prefix_expression,
+    token.TokenType.MINUS: Parser.parse_prefix_expression,
+    token.TokenType.TRUE: Parser.parse_boolean,
+    token.TokenType.FALSE: Parser.parse_boolean,
+    token.TokenType.LPAREN: Parser.parse_grouped_expression,
+    token.TokenType.IF: Parser.parse_if_expression,
+}
+
+# The dispatch tables above flattened into tuples indexed by token type.
+_STATEMENT_PARSER_BY_TYPE = _index_by_type(
+    _STATEMENT_PARSERS, Parser.parse_expression_statement
+)
+_PREFIX_PARSER_BY_TYPE: tuple[PrefixParseFuncType | None, ...] = _index_by_type(
+    _PREFIX_PARSERS, None
+)
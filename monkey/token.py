@@ -1,43 +1,35 @@
 import dataclasses
-from enum import Enum, auto
-from typing import Optional, Any, List
+from enum import IntEnum, auto
+from typing import Dict, Optional, Tuple
 
 
-class AutoName(Enum):
-    @staticmethod
-    def _generate_next_value_(
-        name: str, start: int, count: int, last_values: List[Any]
-    ) -> Any:
-        return name
-
-
-class TokenType(AutoName):
+class TokenType(IntEnum):
     ILLEGAL = auto()
     EOF = auto()
 
     IDENT = auto()
     INT = auto()
 
-    ASSIGN = "="
-    PLUS = "+"
-    MINUS = "-"
-    SLASH = "/"
-    BANG = "!"
-    ASTERISK = "*"
+    ASSIGN = auto()
+    PLUS = auto()
+    MINUS = auto()
+    SLASH = auto()
+    BANG = auto()
+    ASTERISK = auto()
 
-    LT = "<"
-    GT = ">"
+    LT = auto()
+    GT = auto()
 
-    EQ = "=="
-    NOT_EQ = "!="
+    EQ = auto()
+    NOT_EQ = auto()
 
-    COMMA = ","
-    SEMICOLON = ";"
+    COMMA = auto()
+    SEMICOLON = auto()
 
-    LPAREN = "("
-    RPAREN = ")"
-    LBRACE = "{"
-    RBRACE = "}"
+    LPAREN = auto()
+    RPAREN = auto()
+    LBRACE = auto()
+    RBRACE = auto()
 
     FUNCTION = auto()
     LET = auto()
@@ -49,13 +41,59 @@ class TokenType(AutoName):
 
     @classmethod
     def get(cls, val: str) -> Optional["TokenType"]:
-        return cls._value2member_map_.get(val, None)  # type: ignore
+        return SYMBOLS.get(val)
+
+
+SYMBOLS: Dict[str, TokenType] = {
+    "=": TokenType.ASSIGN,
+    "+": TokenType.PLUS,
+    "-": TokenType.MINUS,
+    "/": TokenType.SLASH,
+    "!": TokenType.BANG,
+    "*": TokenType.ASTERISK,
+    "<": TokenType.LT,
+    ">": TokenType.GT,
+    "==": TokenType.EQ,
+    "!=": TokenType.NOT_EQ,
+    ",": TokenType.COMMA,
+    ";": TokenType.SEMICOLON,
+    "(": TokenType.LPAREN,
+    ")": TokenType.RPAREN,
+    "{": TokenType.LBRACE,
+    "}": TokenType.RBRACE,
+}
+
+KEYWORDS: Dict[str, TokenType] = {
+    "let": TokenType.LET,
+    "fn": TokenType.FUNCTION,
+    "true": TokenType.TRUE,
+    "false": TokenType.FALSE,
+    "if": TokenType.IF,
+    "else": TokenType.ELSE,
+    "return": TokenType.RETURN,
+}
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class Token:
     type_: TokenType
     literal: str
 
-    def is_type(self, *token_type: TokenType) -> bool:
-        return self.type_ in token_type
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if type(other) is not Token:
+            return NotImplemented
+        return self.type_ == other.type_ and self.literal == other.literal
+
+    @classmethod
+    def get(cls, type_: TokenType, literal: str) -> "Token":
+        return _SHARED_TOKENS.get((type_, literal)) or cls(type_, literal)
+
+
+# Tokens whose literal never varies are built once and shared, so Token
+# instances must be treated as immutable.
+_SHARED_TOKENS: Dict[Tuple[TokenType, str], Token] = {
+    (type_, literal): Token(type_, literal)
+    for literal, type_ in {**SYMBOLS, **KEYWORDS, "": TokenType.EOF}.items()
+}
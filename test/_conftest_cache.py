@@ -0,0 +1,13 @@
+import functools
+
+from monkey.lexer import Lexer
+from monkey.parser import Parser
+
+
+# Parse results are shared between tests with the same input, so tests must
+# not mutate the returned program or errors.
+@functools.lru_cache(maxsize=256)
+def parse_cached(source):
+    parser = Parser(Lexer(source))
+    program = parser.parse_program()
+    return program, parser.errors
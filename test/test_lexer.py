@@ -1,31 +1,33 @@
-import pytest
-
 from monkey.lexer import Lexer
 from monkey.token import Token, TokenType
 
 
-@pytest.mark.parametrize(
-    "input,expected_token",
-    [
-        ("=", Token(TokenType.ASSIGN, "=")),
-        ("+", Token(TokenType.PLUS, "+")),
-        (",", Token(TokenType.COMMA, ",")),
-        (";", Token(TokenType.SEMICOLON, ";")),
-        ("(", Token(TokenType.LPAREN, "(")),
-        (")", Token(TokenType.RPAREN, ")")),
-        ("{", Token(TokenType.LBRACE, "{")),
-        ("}", Token(TokenType.RBRACE, "}")),
-        ("let", Token(TokenType.LET, "let")),
-        ("letter", Token(TokenType.IDENT, "letter")),
-        ("fn", Token(TokenType.FUNCTION, "fn")),
-        ("fnn", Token(TokenType.IDENT, "fnn")),
-        ("~", Token(TokenType.ILLEGAL, "~")),
-        ("", Token(TokenType.EOF, "")),
-    ],
+NEXT_TOKEN_CASES = (
+    ("=", Token(TokenType.ASSIGN, "=")),
+    ("+", Token(TokenType.PLUS, "+")),
+    (",", Token(TokenType.COMMA, ",")),
+    (";", Token(TokenType.SEMICOLON, ";")),
+    ("(", Token(TokenType.LPAREN, "(")),
+    (")", Token(TokenType.RPAREN, ")")),
+    ("{", Token(TokenType.LBRACE, "{")),
+    ("}", Token(TokenType.RBRACE, "}")),
+    ("let", Token(TokenType.LET, "let")),
+    ("letter", Token(TokenType.IDENT, "letter")),
+    ("fn", Token(TokenType.FUNCTION, "fn")),
+    ("fnn", Token(TokenType.IDENT, "fnn")),
+    ("_foo1", Token(TokenType.IDENT, "_foo1")),
+    ("~", Token(TokenType.ILLEGAL, "~")),
+    ("é", Token(TokenType.ILLEGAL, "é")),
+    ("", Token(TokenType.EOF, "")),
+    (" \t\n", Token(TokenType.EOF, "")),
+    ("\n  let \t\n", Token(TokenType.LET, "let")),
 )
-def test_next_token(input, expected_token):
-    lexer = Lexer(input)
-    assert lexer.next_token() == expected_token
+
+
+def test_next_token():
+    for input, expected_token in NEXT_TOKEN_CASES:
+        lexer = Lexer(input)
+        assert lexer.next_token() == expected_token, input
 
 
 def test_next_token_long():
@@ -132,3 +134,45 @@ if (5 < 10) {
         if token.type_ == TokenType.EOF:
             break
     assert actual == expected_tokens
+
+
+def test_tokenize():
+    lexer = Lexer("let x = 5 == y;")
+    assert lexer.tokenize() == (
+        [
+            TokenType.LET,
+            TokenType.IDENT,
+            TokenType.ASSIGN,
+            TokenType.INT,
+            TokenType.EQ,
+            TokenType.IDENT,
+            TokenType.SEMICOLON,
+            TokenType.EOF,
+        ],
+        ["let", "x", "=", "5", "==", "y", ";", ""],
+    )
+
+
+def test_reset():
+    lexer = Lexer("let")
+    assert lexer.next_token() == Token(TokenType.LET, "let")
+    assert lexer.next_token() == Token(TokenType.EOF, "")
+    lexer.reset("fn")
+    assert lexer.next_token() == Token(TokenType.FUNCTION, "fn")
+
+
+def test_tokenize_after_next_token():
+    lexer = Lexer("let x;")
+    assert lexer.next_token() == Token(TokenType.LET, "let")
+    assert lexer.tokenize() == (
+        [TokenType.IDENT, TokenType.SEMICOLON, TokenType.EOF],
+        ["x", ";", ""],
+    )
+    assert lexer.next_token() == Token(TokenType.EOF, "")
+
+
+def test_fixed_literal_tokens_are_shared():
+    lexer = Lexer("let x == y")
+    assert lexer.next_token() is Token.get(TokenType.LET, "let")
+    assert lexer.next_token() == Token.get(TokenType.IDENT, "x")
+    assert lexer.next_token() is Token.get(TokenType.EQ, "==")
@@ -13,10 +13,43 @@ from monkey.ast import (
     IfExpression,
     BlockStatement,
 )
-from monkey.lexer import Lexer
-from monkey.parser import Parser
 from monkey.token import Token, TokenType
 
+from _conftest_cache import parse_cached
+
+
+# Fixtures shared between parametrize cases are built once at import time.
+def _tok(type_, literal):
+    return Token.get(type_, literal)
+
+
+def _int_lit(literal, value):
+    return IntegerLiteral(token=_tok(TokenType.INT, literal), value=value)
+
+
+def _ident(name):
+    return Identifier(token=_tok(TokenType.IDENT, name), value=name)
+
+
+def _infix(left, type_, operator, right):
+    return InfixExpression(
+        token=_tok(type_, operator), left=left, operator=operator, right=right
+    )
+
+
+def _block(expression):
+    return BlockStatement(
+        token=_tok(TokenType.LBRACE, "{"),
+        statements=[ExpressionStatement(token=expression.token, expression=expression)],
+    )
+
+
+FIVE = _int_lit("5", 5)
+TRUE = Boolean(token=_tok(TokenType.TRUE, "true"), value=True)
+FALSE = Boolean(token=_tok(TokenType.FALSE, "false"), value=False)
+X = _ident("x")
+Y = _ident("y")
+
 
 @pytest.mark.parametrize(
     "input,length",
@@ -32,11 +65,8 @@ let foobar = 838383;
     ],
 )
 def test_parse_program(input, length):
-    lexer = Lexer(input)
-    parser = Parser(lexer)
-
-    program = parser.parse_program()
-    assert not parser.errors
+    program, errors = parse_cached(input)
+    assert not errors
     assert len(program.statements) == length
 
 
@@ -59,11 +89,8 @@ let 838383;
     ],
 )
 def test_parse_program_errors(input, errors):
-    lexer = Lexer(input)
-    parser = Parser(lexer)
-
-    parser.parse_program()
-    assert parser.errors == errors
+    _, actual_errors = parse_cached(input)
+    assert actual_errors == errors
 
 
 @pytest.mark.parametrize(
@@ -75,11 +102,8 @@ def test_parse_program_errors(input, errors):
     ],
 )
 def test_let_statements(input, name, value):
-    lexer = Lexer(input)
-    parser = Parser(lexer)
-
-    program = parser.parse_program()
-    assert not parser.errors
+    program, errors = parse_cached(input)
+    assert not errors
     assert len(program.statements) == 1
 
     statement = program.statements[0]
@@ -97,11 +121,8 @@ def test_let_statements(input, name, value):
     ],
 )
 def test_return_statements(input, value):
-    lexer = Lexer(input)
-    parser = Parser(lexer)
-
-    program = parser.parse_program()
-    assert not parser.errors
+    program, errors = parse_cached(input)
+    assert not errors
     assert len(program.statements) == 1
 
     statement = program.statements[0]
@@ -129,11 +150,8 @@ def test_string():
 
 def test_identifier_expression():
     input = "foobar;"
-    lexer = Lexer(input)
-    parser = Parser(lexer)
-
-    program = parser.parse_program()
-    assert not parser.errors
+    program, errors = parse_cached(input)
+    assert not errors
     ident = Token(type_=TokenType.IDENT, literal="foobar")
     assert program.statements == [
         ExpressionStatement(
@@ -145,60 +163,53 @@ def test_identifier_expression():
 @pytest.mark.parametrize(
     "input,expression",
     [
-        ("5;", IntegerLiteral(token=Token(type_=TokenType.INT, literal="5"), value=5)),
-        (
-            "true;",
-            Boolean(token=Token(type_=TokenType.TRUE, literal="true"), value=True),
-        ),
-        (
-            "false;",
-            Boolean(token=Token(type_=TokenType.FALSE, literal="false"), value=False),
-        ),
+        ("5;", FIVE),
+        ("true;", TRUE),
+        ("false;", FALSE),
     ],
 )
 def test_literal_expression(input, expression):
-    lexer = Lexer(input)
-    parser = Parser(lexer)
-
-    program = parser.parse_program()
-    assert not parser.errors
+    program, errors = parse_cached(input)
+    assert not errors
     assert len(program.statements) == 1
     statement = program.statements[0]
     assert isinstance(statement, ExpressionStatement)
     assert statement.expression == expression
 
 
+def test_repeated_leaves_share_nodes():
+    program, errors = parse_cached("x + 5 * x - 5;")
+    assert not errors
+    statement = program.statements[0]
+    assert isinstance(statement, ExpressionStatement)
+    expression = statement.expression
+    assert isinstance(expression, InfixExpression)
+    assert isinstance(expression.left, InfixExpression)
+    assert isinstance(expression.left.right, InfixExpression)
+    assert expression.left.left is expression.left.right.right
+    assert expression.left.right.left is expression.right
+
+
 @pytest.mark.parametrize(
     "input,expression",
     [
         (
             "!5;",
-            PrefixExpression(
-                token=Token(type_=TokenType.BANG, literal="!"),
-                operator="!",
-                right=IntegerLiteral(
-                    token=Token(type_=TokenType.INT, literal="5"), value=5
-                ),
-            ),
+            PrefixExpression(token=_tok(TokenType.BANG, "!"), operator="!", right=FIVE),
         ),
         (
             "-15;",
             PrefixExpression(
-                token=Token(type_=TokenType.MINUS, literal="-"),
+                token=_tok(TokenType.MINUS, "-"),
                 operator="-",
-                right=IntegerLiteral(
-                    token=Token(type_=TokenType.INT, literal="15"), value=15
-                ),
+                right=_int_lit("15", 15),
             ),
         ),
     ],
 )
 def test_parsing_prefix_expressions(input, expression):
-    lexer = Lexer(input)
-    parser = Parser(lexer)
-
-    program = parser.parse_program()
-    assert not parser.errors
+    program, errors = parse_cached(input)
+    assert not errors
     assert program.statements == [
         ExpressionStatement(token=expression.token, expression=expression)
     ]
@@ -209,155 +220,53 @@ def test_parsing_prefix_expressions(input, expression):
     [
         (
             "5 + 5;",
-            InfixExpression(
-                token=Token(type_=TokenType.PLUS, literal="+"),
-                left=IntegerLiteral(
-                    token=Token(type_=TokenType.INT, literal="5"), value=5
-                ),
-                operator="+",
-                right=IntegerLiteral(
-                    token=Token(type_=TokenType.INT, literal="5"), value=5
-                ),
-            ),
+            _infix(FIVE, TokenType.PLUS, "+", FIVE),
         ),
         (
             "5 - 5;",
-            InfixExpression(
-                token=Token(type_=TokenType.MINUS, literal="-"),
-                left=IntegerLiteral(
-                    token=Token(type_=TokenType.INT, literal="5"), value=5
-                ),
-                operator="-",
-                right=IntegerLiteral(
-                    token=Token(type_=TokenType.INT, literal="5"), value=5
-                ),
-            ),
+            _infix(FIVE, TokenType.MINUS, "-", FIVE),
         ),
         (
             "5 * 5;",
-            InfixExpression(
-                token=Token(type_=TokenType.ASTERISK, literal="*"),
-                left=IntegerLiteral(
-                    token=Token(type_=TokenType.INT, literal="5"), value=5
-                ),
-                operator="*",
-                right=IntegerLiteral(
-                    token=Token(type_=TokenType.INT, literal="5"), value=5
-                ),
-            ),
+            _infix(FIVE, TokenType.ASTERISK, "*", FIVE),
         ),
         (
             "5 / 5;",
-            InfixExpression(
-                token=Token(type_=TokenType.SLASH, literal="/"),
-                left=IntegerLiteral(
-                    token=Token(type_=TokenType.INT, literal="5"), value=5
-                ),
-                operator="/",
-                right=IntegerLiteral(
-                    token=Token(type_=TokenType.INT, literal="5"), value=5
-                ),
-            ),
+            _infix(FIVE, TokenType.SLASH, "/", FIVE),
         ),
         (
             "5 > 5;",
-            InfixExpression(
-                token=Token(type_=TokenType.GT, literal=">"),
-                left=IntegerLiteral(
-                    token=Token(type_=TokenType.INT, literal="5"), value=5
-                ),
-                operator=">",
-                right=IntegerLiteral(
-                    token=Token(type_=TokenType.INT, literal="5"), value=5
-                ),
-            ),
+            _infix(FIVE, TokenType.GT, ">", FIVE),
         ),
         (
             "5 < 5;",
-            InfixExpression(
-                token=Token(type_=TokenType.LT, literal="<"),
-                left=IntegerLiteral(
-                    token=Token(type_=TokenType.INT, literal="5"), value=5
-                ),
-                operator="<",
-                right=IntegerLiteral(
-                    token=Token(type_=TokenType.INT, literal="5"), value=5
-                ),
-            ),
+            _infix(FIVE, TokenType.LT, "<", FIVE),
         ),
         (
             "5 == 5;",
-            InfixExpression(
-                token=Token(type_=TokenType.EQ, literal="=="),
-                left=IntegerLiteral(
-                    token=Token(type_=TokenType.INT, literal="5"), value=5
-                ),
-                operator="==",
-                right=IntegerLiteral(
-                    token=Token(type_=TokenType.INT, literal="5"), value=5
-                ),
-            ),
+            _infix(FIVE, TokenType.EQ, "==", FIVE),
         ),
         (
             "5 != 5;",
-            InfixExpression(
-                token=Token(type_=TokenType.NOT_EQ, literal="!="),
-                left=IntegerLiteral(
-                    token=Token(type_=TokenType.INT, literal="5"), value=5
-                ),
-                operator="!=",
-                right=IntegerLiteral(
-                    token=Token(type_=TokenType.INT, literal="5"), value=5
-                ),
-            ),
+            _infix(FIVE, TokenType.NOT_EQ, "!=", FIVE),
         ),
         (
             "true == true;",
-            InfixExpression(
-                token=Token(type_=TokenType.EQ, literal="=="),
-                left=Boolean(
-                    token=Token(type_=TokenType.TRUE, literal="true"), value=True
-                ),
-                operator="==",
-                right=Boolean(
-                    token=Token(type_=TokenType.TRUE, literal="true"), value=True
-                ),
-            ),
+            _infix(TRUE, TokenType.EQ, "==", TRUE),
         ),
         (
             "true != false;",
-            InfixExpression(
-                token=Token(type_=TokenType.NOT_EQ, literal="!="),
-                left=Boolean(
-                    token=Token(type_=TokenType.TRUE, literal="true"), value=True
-                ),
-                operator="!=",
-                right=Boolean(
-                    token=Token(type_=TokenType.FALSE, literal="false"), value=False
-                ),
-            ),
+            _infix(TRUE, TokenType.NOT_EQ, "!=", FALSE),
         ),
         (
             "false == false;",
-            InfixExpression(
-                token=Token(type_=TokenType.EQ, literal="=="),
-                left=Boolean(
-                    token=Token(type_=TokenType.FALSE, literal="false"), value=False
-                ),
-                operator="==",
-                right=Boolean(
-                    token=Token(type_=TokenType.FALSE, literal="false"), value=False
-                ),
-            ),
+            _infix(FALSE, TokenType.EQ, "==", FALSE),
         ),
     ],
 )
 def test_parsing_infix_expressions(input, expression):
-    lexer = Lexer(input)
-    parser = Parser(lexer)
-
-    program = parser.parse_program()
-    assert not parser.errors
+    program, errors = parse_cached(input)
+    assert not errors
     assert len(program.statements) == 1
     statement = program.statements[0]
     assert isinstance(statement, ExpressionStatement)
@@ -376,14 +285,15 @@ def test_parsing_infix_expressions(input, expression):
         ("2 / (5 + 5)", "(2 / (5 + 5))"),
         ("-(5 + 5)", "(-(5 + 5))"),
         ("!(true == true)", "(!(true == true))"),
+        ("-a * b", "((-a) * b)"),
+        ("a + b * c + d / e - f", "(((a + (b * c)) + (d / e)) - f)"),
+        ("5 > 4 == 3 < 4", "((5 > 4) == (3 < 4))"),
+        ("3 + 4 * 5 == 3 * 1 + 4 * 5", "((3 + (4 * 5)) == ((3 * 1) + (4 * 5)))"),
     ],
 )
 def test_operator_precedence_parsing(input, expected):
-    lexer = Lexer(input)
-    parser = Parser(lexer)
-
-    program = parser.parse_program()
-    assert not parser.errors
+    program, errors = parse_cached(input)
+    assert not errors
     assert len(program.statements) == 1
     assert program.statements[0].string() == expected
 
@@ -394,80 +304,26 @@ def test_operator_precedence_parsing(input, expected):
         (
             "if (x < y) { x }",
             IfExpression(
-                token=Token(type_=TokenType.IF, literal="if"),
-                condition=InfixExpression(
-                    token=Token(type_=TokenType.LT, literal="<"),
-                    left=Identifier(
-                        token=Token(type_=TokenType.IDENT, literal="x"), value="x"
-                    ),
-                    operator="<",
-                    right=Identifier(
-                        token=Token(type_=TokenType.IDENT, literal="y"), value="y"
-                    ),
-                ),
-                consequence=BlockStatement(
-                    token=Token(type_=TokenType.LBRACE, literal="{"),
-                    statements=[
-                        ExpressionStatement(
-                            token=Token(type_=TokenType.IDENT, literal="x"),
-                            expression=Identifier(
-                                token=Token(type_=TokenType.IDENT, literal="x"),
-                                value="x",
-                            ),
-                        )
-                    ],
-                ),
+                token=_tok(TokenType.IF, "if"),
+                condition=_infix(X, TokenType.LT, "<", Y),
+                consequence=_block(X),
                 alternative=None,
             ),
         ),
         (
             "if (x < y) { x } else { y }",
             IfExpression(
-                token=Token(type_=TokenType.IF, literal="if"),
-                condition=InfixExpression(
-                    token=Token(type_=TokenType.LT, literal="<"),
-                    left=Identifier(
-                        token=Token(type_=TokenType.IDENT, literal="x"), value="x"
-                    ),
-                    operator="<",
-                    right=Identifier(
-                        token=Token(type_=TokenType.IDENT, literal="y"), value="y"
-                    ),
-                ),
-                consequence=BlockStatement(
-                    token=Token(type_=TokenType.LBRACE, literal="{"),
-                    statements=[
-                        ExpressionStatement(
-                            token=Token(type_=TokenType.IDENT, literal="x"),
-                            expression=Identifier(
-                                token=Token(type_=TokenType.IDENT, literal="x"),
-                                value="x",
-                            ),
-                        )
-                    ],
-                ),
-                alternative=BlockStatement(
-                    token=Token(type_=TokenType.LBRACE, literal="{"),
-                    statements=[
-                        ExpressionStatement(
-                            token=Token(type_=TokenType.IDENT, literal="y"),
-                            expression=Identifier(
-                                token=Token(type_=TokenType.IDENT, literal="y"),
-                                value="y",
-                            ),
-                        )
-                    ],
-                ),
+                token=_tok(TokenType.IF, "if"),
+                condition=_infix(X, TokenType.LT, "<", Y),
+                consequence=_block(X),
+                alternative=_block(Y),
             ),
         ),
     ],
 )
 def test_if_expression(input, expected):
-    lexer = Lexer(input)
-    parser = Parser(lexer)
-
-    program = parser.parse_program()
-    assert not parser.errors
+    program, errors = parse_cached(input)
+    assert not errors
     statement = program.statements[0]
     assert isinstance(statement, ExpressionStatement)
     assert statement.expression == expected
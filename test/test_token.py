@@ -0,0 +1,14 @@
+import dataclasses
+
+import pytest
+
+from monkey.token import Token, TokenType
+
+
+def test_token_is_compact_and_immutable():
+    tok = Token(type_=TokenType.IDENT, literal="x")
+    assert not hasattr(tok, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        tok.literal = "y"  # type: ignore
+    assert hash(tok) == hash(Token(TokenType.IDENT, "x"))
+    assert tok != (TokenType.IDENT, "x")